@@ -53,8 +53,9 @@ export default function SearchFilters({ isDark }: SearchFiltersProps) {
 
   const filterByGlobalSearch = (items: any[], key: string = 'label') => {
     if (!globalSearch) return items;
+    const searchLower = globalSearch.toLowerCase();
     return items.filter(item => 
-      item[key].toLowerCase().includes(globalSearch.toLowerCase())
+      item[key].toLowerCase().includes(searchLower)
     );
   };
 
@@ -26,8 +26,9 @@ export function ThemeSelector({ isDark, activeTheme, onThemeChange, onDarkModeCh
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, []);
 
+  const searchLower = searchQuery.toLowerCase();
   const filteredThemes = themes.filter(theme => 
-    theme.name.toLowerCase().includes(searchQuery.toLowerCase())
+    theme.name.toLowerCase().includes(searchLower)
   );
 
   const handleThemeSelect = (themeName: string, isDarkTheme: boolean) => {
@@ -51,8 +51,9 @@ export function UniversityDropdown({ value, onChange, required = false }: Univer
 
   const selectedUniversity = universities.find(uni => uni.name === value);
 
+  const searchLower = searchQuery.toLowerCase();
   const filteredUniversities = universities.filter(uni =>
-    uni.name.toLowerCase().includes(searchQuery.toLowerCase())
+    uni.name.toLowerCase().includes(searchLower)
   );
 
   return (
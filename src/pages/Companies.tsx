@@ -36,6 +36,16 @@ const expandVariants = {
   }
 };
 
+// Lowercased searchable fields, built once since companies is static
+const searchableCompanies = companies.map(company => ({
+  company,
+  searchText: [
+    company.name,
+    company.description,
+    company.industry
+  ].join('\n').toLowerCase()
+}));
+
 export function Companies() {
   const [searchQuery, setSearchQuery] = useState('');
   const [expandedCompany, setExpandedCompany] = useState<string | null>(null);
@@ -58,14 +68,10 @@ export function Companies() {
     setExpandedCompany(current => current === companyId ? null : companyId);
   };
 
-  const filteredCompanies = companies.filter(company => {
-    const matchesSearch = 
-      company.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      company.description.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      company.industry.toLowerCase().includes(searchQuery.toLowerCase());
-
-    return matchesSearch;
-  });
+  const searchLower = searchQuery.toLowerCase();
+  const filteredCompanies = searchableCompanies
+    .filter(({ searchText }) => searchText.includes(searchLower))
+    .map(({ company }) => company);
 
   return (
     <div className="h-screen flex">
@@ -36,6 +36,18 @@ const expandVariants = {
   }
 };
 
+// Lowercased searchable fields, built once since mockPeople is static
+const searchablePeople = mockPeople.map(person => ({
+  person,
+  searchText: [
+    person.name,
+    person.currentRole,
+    person.currentCompany,
+    person.bio,
+    ...person.skills
+  ].join('\n').toLowerCase()
+}));
+
 export function Directory() {
   const [searchQuery, setSearchQuery] = useState('');
   const [expandedPerson, setExpandedPerson] = useState<string | null>(null);
@@ -58,16 +70,10 @@ export function Directory() {
     setExpandedPerson(current => current === personId ? null : personId);
   };
 
-  const filteredPeople = mockPeople.filter(person => {
-    const matchesSearch = 
-      person.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      person.currentRole.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      person.currentCompany.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      person.bio.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      person.skills.some(skill => skill.toLowerCase().includes(searchQuery.toLowerCase()));
-
-    return matchesSearch;
-  });
+  const searchLower = searchQuery.toLowerCase();
+  const filteredPeople = searchablePeople
+    .filter(({ searchText }) => searchText.includes(searchLower))
+    .map(({ person }) => person);
 
   return (
     <div className="h-screen flex">
@@ -36,6 +36,17 @@ const expandVariants = {
   }
 };
 
+// Lowercased searchable fields, built once since jobs is static
+const searchableJobs = jobs.map(job => ({
+  job,
+  searchText: [
+    job.title,
+    job.company,
+    job.description,
+    ...job.skills
+  ].join('\n').toLowerCase()
+}));
+
 export function Jobs() {
   const [searchQuery, setSearchQuery] = useState('');
   const [expandedJob, setExpandedJob] = useState<string | null>(null);
@@ -58,15 +69,10 @@ export function Jobs() {
     setExpandedJob(current => current === jobId ? null : jobId);
   };
 
-  const filteredJobs = jobs.filter(job => {
-    const matchesSearch = 
-      job.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      job.company.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      job.description.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      job.skills.some(skill => skill.toLowerCase().includes(searchQuery.toLowerCase()));
-
-    return matchesSearch;
-  });
+  const searchLower = searchQuery.toLowerCase();
+  const filteredJobs = searchableJobs
+    .filter(({ searchText }) => searchText.includes(searchLower))
+    .map(({ job }) => job);
 
   return (
     <div className="h-screen flex">
@@ -9,8 +9,10 @@ async function callAIProxy(model: string, query: string, category: string, onUpd
     }
 
     const functionUrl = `${SUPABASE_URL}/functions/v1/ai-proxy`;
-    console.log(`Calling ${model} API with query:`, query);
-    console.log('Function URL:', functionUrl);
+    if (import.meta.env.DEV) {
+      console.debug(`Calling ${model} API with query:`, query);
+      console.debug('Function URL:', functionUrl);
+    }
     
     const response = await fetch(functionUrl, {
       method: 'POST',
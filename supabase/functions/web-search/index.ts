@@ -46,12 +46,23 @@ async function performWebSearch(query: string, category: string): Promise<Search
   }
 }
 
+const resultTypePatterns: [RegExp, string][] = [
+  [/fellowship/i, 'Fellowship'],
+  [/grant/i, 'Grant'],
+  [/program/i, 'Program'],
+  [/resource/i, 'Resource'],
+];
+
+const requirementPatterns = [
+  'must have', 'required', 'requirements:', 'eligibility:', 'qualifications:',
+  'prerequisites:', 'criteria:', 'applicants must'
+].map(indicator => new RegExp(`${indicator}\\s*([^.]+)`, 'i'));
+
 function detectResultType(title: string, snippet: string): string | undefined {
-  const text = `${title} ${snippet}`.toLowerCase();
-  if (text.includes('fellowship')) return 'Fellowship';
-  if (text.includes('grant')) return 'Grant';
-  if (text.includes('program')) return 'Program';
-  if (text.includes('resource')) return 'Resource';
+  const text = `${title} ${snippet}`;
+  for (const [pattern, type] of resultTypePatterns) {
+    if (pattern.test(text)) return type;
+  }
   return undefined;
 }
 
@@ -68,15 +79,9 @@ function extractAmount(text: string): string | undefined {
 }
 
 function extractRequirements(text: string): string[] | undefined {
-  const requirementIndicators = [
-    'must have', 'required', 'requirements:', 'eligibility:', 'qualifications:',
-    'prerequisites:', 'criteria:', 'applicants must'
-  ];
-  
   let requirements: string[] = [];
   
-  for (const indicator of requirementIndicators) {
-    const pattern = new RegExp(`${indicator}\\s*([^.]+)`, 'i');
+  for (const pattern of requirementPatterns) {
     const match = text.match(pattern);
     if (match) {
       const reqs = match[1]